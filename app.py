@@ -9,7 +9,9 @@ from sklearn.preprocessing import OneHotEncoder, StandardScaler
 from sklearn.compose import ColumnTransformer
 from sklearn.pipeline import make_pipeline
 from sklearn.impute import SimpleImputer
-from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import LinearRegression
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce
 
 # ---------------------- STREAMLIT PAGE CONFIG ----------------------
 st.set_page_config(
@@ -33,33 +35,261 @@ st.markdown(
 # ---------------------- LOAD DATA ----------------------
 @st.cache_data
 def load_data():
-    orders = pd.read_csv("orders.csv")
-    delivery = pd.read_csv("delivery_performance.csv")
-    routes = pd.read_csv("routes_distance.csv")
-    fleet = pd.read_csv("vehicle_fleet.csv")
-    warehouse = pd.read_csv("warehouse_inventory.csv")
-    feedback = pd.read_csv("customer_feedback.csv")
-    costs = pd.read_csv("cost_breakdown.csv")
-    return orders, delivery, routes, fleet, warehouse, feedback, costs
+    files = {
+        "orders": "orders.parquet",
+        "delivery": "delivery_performance.parquet",
+        "routes": "routes_distance.parquet",
+        "fleet": "vehicle_fleet.parquet",
+        "warehouse": "warehouse_inventory.parquet",
+        "feedback": "customer_feedback.parquet",
+        "costs": "cost_breakdown.parquet",
+    }
+    with ThreadPoolExecutor(max_workers=len(files)) as ex:
+        frames = ex.map(pd.read_parquet, files.values())
+        return dict(zip(files, frames))
 
 
-orders, delivery, routes, fleet, warehouse, feedback, costs = load_data()
-
 # ---------------------- DATA MERGE ----------------------
-merged = (
-    orders.merge(delivery, on="Order_ID", how="left")
-    .merge(routes, on="Order_ID", how="left")
-    .merge(costs, on="Order_ID", how="left")
-)
+@st.cache_data(persist="disk")
+def build_merged(orders, delivery, routes, costs, feedback):
+    # Every table is keyed on Order_ID, so when the right-hand keys are unique the
+    # left joins reduce to aligning each table to the orders' keys and one concat.
+    lookups = [delivery, routes, costs, feedback]
+    if all(df["Order_ID"].is_unique for df in lookups):
+        keys = orders["Order_ID"]
+        merged = pd.concat(
+            [orders.reset_index(drop=True)]
+            + [df.set_index("Order_ID").reindex(keys).reset_index(drop=True) for df in lookups],
+            axis=1,
+        )
+    else:
+        merged = reduce(lambda left, right: left.merge(right, on="Order_ID", how="left"), lookups, orders)
+
+    # Group / colour keys as categoricals (a no-op when loaded from the typed Parquet)
+    for col in ["Route", "Delivery_Status", "Carrier"]:
+        merged[col] = merged[col].astype("category")
+
+    # INR amounts, distances and day counts fit comfortably in 32-bit (or smaller) types
+    for col in merged.select_dtypes("float").columns:
+        merged[col] = pd.to_numeric(merged[col], downcast="float")
+    for col in merged.select_dtypes("integer").columns:
+        merged[col] = pd.to_numeric(merged[col], downcast="integer")
+    return merged
+
+
+# Derived cost metrics (and the per-component averages) are layered on top of the
+# base merge, so only the pages that use them pay for (and cache) them.
+@st.cache_data(persist="disk")
+def add_cost_metrics(merged):
+    # Missing cost components count as zero, as with DataFrame.sum
+    cost_cols = ["Fuel_Cost", "Labor_Cost", "Vehicle_Maintenance", "Insurance",
+                 "Packaging_Cost", "Technology_Platform_Fee", "Other_Overhead"]
+    cost_mat = np.ascontiguousarray(merged[cost_cols].to_numpy(dtype=np.float32, na_value=0.0))
+    total_cost = cost_mat.sum(axis=1)
+
+    # Per-component averages over the orders that have that component, as with DataFrame.mean
+    present = merged[cost_cols].notna().to_numpy().sum(axis=0)
+    cost_summary = pd.DataFrame({"Cost_Type": cost_cols, "Average_INR": cost_mat.sum(axis=0) / present})
+
+    # Ratio and delay are written into their own fresh buffers, so no temporaries
+    cost_ratio = merged["Order_Value_INR"].to_numpy(dtype=np.float32, copy=True)
+    np.divide(total_cost, cost_ratio, out=cost_ratio)
+    delay = merged["Actual_Delivery_Days"].to_numpy(dtype=np.float32, copy=True)
+    np.subtract(delay, merged["Promised_Delivery_Days"].to_numpy(np.float32), out=delay)
+
+    merged = merged.assign(Total_Cost=total_cost, Cost_to_OrderValue=cost_ratio, Delivery_Delay=delay)
+    return merged, cost_summary
+
+
+data = load_data()
+orders, delivery, routes, costs = data["orders"], data["delivery"], data["routes"], data["costs"]
+fleet, warehouse, feedback = data["fleet"], data["warehouse"], data["feedback"]
+base = build_merged(orders, delivery, routes, costs, feedback)
+
+
+# ---------------------- AGGREGATION ----------------------
+def group_means(df, key, **columns):
+    # Per-group means of columns (output name -> source column), keyed on the
+    # integer codes of a categorical: a stable argsort brings each group together,
+    # then a single np.add.reduceat sums every run of all columns at once. NaN keys
+    # and values are skipped, as in DataFrame.groupby(...).mean().
+    codes = df[key].cat.codes.to_numpy()
+    rows = np.flatnonzero(codes >= 0)
+    if len(rows) == 0:
+        return pd.DataFrame(columns=[key, *columns])
+    order = rows[np.argsort(codes[rows], kind="stable")]
+    sorted_codes = codes[order]
+    boundaries = np.r_[0, np.flatnonzero(np.diff(sorted_codes)) + 1]
+
+    # One (rows x columns) block in group order, reduced in a single pass
+    block = df[list(columns.values())].to_numpy(dtype=np.float64)[order]
+    valid = ~np.isnan(block)
+    np.copyto(block, 0.0, where=~valid)
+    sums = np.add.reduceat(block, boundaries, axis=0)
+    counts = np.add.reduceat(valid, boundaries, axis=0, dtype=np.int64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums / counts
+
+    out = pd.DataFrame(means, columns=list(columns))
+    out.insert(0, key, df[key].cat.categories.take(sorted_codes[boundaries]))
+    return out
+
+
+# ---------------------- COST MODEL ----------------------
+@st.cache_resource
+def get_cost_model(X, y):
+    # Total_Cost is additive in its components, so ordinary least squares fits it
+    # exactly in closed form.
+    model = LinearRegression()
+    model.fit(X, y)
+    return model
+
+
+def predict_cost(model, X):
+    # Apply the fitted coefficients directly, skipping the estimator's per-call
+    # input validation.
+    Xv = np.ascontiguousarray(X, dtype=np.float32)
+    return Xv @ model.coef_.astype(np.float32) + np.float32(model.intercept_)
+
+
+# ---------------------- DOWNSAMPLING ----------------------
+def lttb_indices(y, n_out):
+    # Largest-Triangle-Three-Buckets: keep the first and last points and, from each
+    # bucket in between, the point spanning the largest triangle with the previously
+    # kept point and the mean of the next bucket.
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    y = np.asarray(y, dtype=np.float64)
+    x = np.arange(n, dtype=np.float64)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    edges = np.append(edges, n)
+
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        avg_x = x[end:edges[i + 2]].mean()
+        avg_y = y[end:edges[i + 2]].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        idx[i + 1] = a
+    return idx
+
+
+# ---------------------- CHARTS ----------------------
+# Figure builders are cached on the content of the frames they plot, so Plotly
+# only builds each figure once per distinct input.
+def hash_frame(df):
+    return pd.util.hash_pandas_object(df, index=False).values.tobytes()
+
+
+@st.cache_data(hash_funcs={pd.DataFrame: hash_frame})
+def fig_cost_breakdown(cost_summary):
+    return px.bar(cost_summary, x="Cost_Type", y="Average_INR",
+                  color="Cost_Type", title="Average Cost Breakdown (INR)",
+                  color_discrete_sequence=px.colors.qualitative.Vivid)
+
+
+@st.cache_data(hash_funcs={pd.DataFrame: hash_frame})
+def fig_delay_vs_rating(df):
+    fig = px.scatter(
+        df,
+        x="Delivery_Delay",
+        y="Customer_Rating",
+        color="Delivery_Status",
+        title="Delivery Delay vs Customer Rating",
+        color_discrete_sequence=px.colors.qualitative.Safe,
+        render_mode="webgl",
+    )
+    fig.update_traces(marker=dict(size=10, opacity=0.7, line=dict(width=1, color='DarkSlateGrey')))
+    return fig
+
+
+@st.cache_data(hash_funcs={pd.DataFrame: hash_frame})
+def fig_cost_ratio_distribution(df):
+    return px.histogram(
+        df, x="Cost_to_OrderValue", nbins=30, color_discrete_sequence=["#FF7F50"],
+        title="Distribution of Cost-to-Order Value Ratio"
+    )
+
+
+@st.cache_data(hash_funcs={pd.DataFrame: hash_frame})
+def fig_delay_vs_cost_ratio(df):
+    return px.scatter(
+        df, x="Delivery_Delay", y="Cost_to_OrderValue", color="Delivery_Status",
+        title="Delivery Delay vs Cost-to-Order Value Ratio",
+        color_discrete_sequence=px.colors.qualitative.Prism,
+        render_mode="webgl"
+    )
+
+
+@st.cache_data(hash_funcs={pd.DataFrame: hash_frame})
+def fig_route_costs(route_summary):
+    return px.scatter(
+        route_summary, x="Distance_KM", y="Avg_Total_Cost",
+        size="Fuel_Consumption_L", color="Toll_Charges_INR",
+        hover_name="Route", title="Route Distance vs Avg Total Cost",
+        color_continuous_scale="Viridis", render_mode="webgl"
+    )
+
+
+@st.cache_data(hash_funcs={pd.DataFrame: hash_frame})
+def fig_fleet_efficiency(fleet, title, size=None):
+    return px.scatter(
+        fleet, x="Age_Years", y="Fuel_Efficiency_KM_per_L",
+        color="Vehicle_Type", size=size, title=title,
+        color_discrete_sequence=px.colors.qualitative.D3, render_mode="webgl"
+    )
+
+
+@st.cache_data(hash_funcs={pd.DataFrame: hash_frame})
+def fig_warehouse_costs(warehouse, title):
+    return px.bar(
+        warehouse, x="Location", y="Storage_Cost_per_Unit",
+        color="Product_Category", title=title,
+        color_discrete_sequence=px.colors.qualitative.Bold
+    )
+
+
+@st.cache_data(hash_funcs={pd.DataFrame: hash_frame})
+def fig_feedback_costs(df):
+    return px.box(
+        df, x="Rating", y="Cost_to_OrderValue",
+        color="Would_Recommend", title="Customer Rating vs Cost-to-Order Value",
+        color_discrete_sequence=px.colors.qualitative.Safe
+    )
+
+
+@st.cache_data(hash_funcs={pd.DataFrame: hash_frame})
+def fig_route_performance(route_perf):
+    return px.scatter_3d(
+        route_perf, x="Distance_KM", y="Toll_Charges_INR", z="Traffic_Delay_Minutes",
+        color="Traffic_Delay_Minutes", title="Route Performance: Distance vs Toll vs Delay",
+        color_continuous_scale="Turbo"
+    )
+
 
-# Derived Metrics
-merged["Total_Cost"] = merged[
-    ["Fuel_Cost", "Labor_Cost", "Vehicle_Maintenance", "Insurance",
-     "Packaging_Cost", "Technology_Platform_Fee", "Other_Overhead"]
-].sum(axis=1)
+@st.cache_data
+def fig_actual_vs_predicted(x, actual, predicted):
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(x=x, y=actual,
+                               mode='lines', name='Actual Cost', line=dict(color='royalblue')))
+    fig.add_trace(go.Scattergl(x=x, y=predicted,
+                               mode='lines', name='Predicted Cost', line=dict(color='orange')))
+    fig.update_layout(title="Actual vs Predicted Total Cost",
+                      xaxis_title="Order (sorted by Order ID)", yaxis_title="Cost (INR)")
+    return fig
+
+
+@st.cache_data(hash_funcs={pd.DataFrame: hash_frame})
+def fig_savings(rec_data):
+    return px.bar(rec_data, x="Strategy", y="Potential_Savings_%",
+                  color="Strategy", text="Potential_Savings_%",
+                  color_discrete_sequence=px.colors.qualitative.Alphabet,
+                  title="Estimated Savings by Recommendation (%)")
 
-merged["Cost_to_OrderValue"] = merged["Total_Cost"] / merged["Order_Value_INR"]
-merged["Delivery_Delay"] = merged["Actual_Delivery_Days"] - merged["Promised_Delivery_Days"]
 
 # ---------------------- SIDEBAR ----------------------
 st.sidebar.header("📊 Dashboard Navigation")
@@ -71,6 +301,7 @@ page = st.sidebar.radio(
 # ---------------------- 1. OVERVIEW DASHBOARD ----------------------
 if page == "Overview Dashboard":
     st.subheader("📈 Business Overview")
+    merged, cost_summary = add_cost_metrics(base)
 
     col1, col2, col3 = st.columns(3)
     with col1:
@@ -81,39 +312,21 @@ if page == "Overview Dashboard":
         st.metric("Average Customer Rating", f"{delivery['Customer_Rating'].mean():.2f}")
 
     # Plot 1 - Cost Breakdown Distribution
-    cost_cols = ["Fuel_Cost", "Labor_Cost", "Vehicle_Maintenance", "Insurance",
-                 "Packaging_Cost", "Technology_Platform_Fee", "Other_Overhead"]
-    cost_summary = merged[cost_cols].mean().reset_index()
-    cost_summary.columns = ["Cost_Type", "Average_INR"]
-
-    fig1 = px.bar(cost_summary, x="Cost_Type", y="Average_INR",
-                  color="Cost_Type", title="Average Cost Breakdown (INR)",
-                  color_discrete_sequence=px.colors.qualitative.Vivid)
+    fig1 = fig_cost_breakdown(cost_summary)
     st.plotly_chart(fig1, use_container_width=True)
 
-    fig2 = px.scatter(
-    merged,
-    x="Delivery_Delay",
-    y="Customer_Rating",
-    color="Delivery_Status",
-    title="Delivery Delay vs Customer Rating",
-    color_discrete_sequence=px.colors.qualitative.Safe,
-)
-    fig2.update_traces(marker=dict(size=10, opacity=0.7, line=dict(width=1, color='DarkSlateGrey')))
-
+    fig2 = fig_delay_vs_rating(merged[["Delivery_Delay", "Customer_Rating", "Delivery_Status"]])
     st.plotly_chart(fig2, use_container_width=True)
 
 
 # ---------------------- 2. COST LEAKAGE ANALYSIS ----------------------
 elif page == "Cost Leakage Analysis":
     st.subheader("💸 Cost Leakage Detection and Analysis")
+    merged, _ = add_cost_metrics(base)
 
     # --- 1️⃣ Overall Cost-to-Order Value Distribution ---
     st.markdown("### 1️⃣ Perform Cost Analysis")
-    fig3 = px.histogram(
-        merged, x="Cost_to_OrderValue", nbins=30, color_discrete_sequence=["#FF7F50"],
-        title="Distribution of Cost-to-Order Value Ratio"
-    )
+    fig3 = fig_cost_ratio_distribution(merged[["Cost_to_OrderValue"]])
     st.plotly_chart(fig3, use_container_width=True)
 
     avg_ratio = merged["Cost_to_OrderValue"].mean()
@@ -129,11 +342,7 @@ elif page == "Cost Leakage Analysis":
     # --- 2️⃣ Delivery Performance vs Cost Impact ---
     st.markdown("### 2️⃣ Analyze Delivery Performance and Its Impact on Costs")
 
-    fig4 = px.scatter(
-        merged, x="Delivery_Delay", y="Cost_to_OrderValue", color="Delivery_Status",
-        title="Delivery Delay vs Cost-to-Order Value Ratio",
-        color_discrete_sequence=px.colors.qualitative.Prism
-    )
+    fig4 = fig_delay_vs_cost_ratio(merged[["Delivery_Delay", "Cost_to_OrderValue", "Delivery_Status"]])
     st.plotly_chart(fig4, use_container_width=True)
 
     st.markdown("""
@@ -144,15 +353,15 @@ elif page == "Cost Leakage Analysis":
     # --- 3️⃣ Route Cost Implications ---
     st.markdown("### 3️⃣ Analyze Routes and Their Cost Implications")
 
-    route_summary = merged.groupby("Route")[["Distance_KM", "Toll_Charges_INR", "Fuel_Consumption_L"]].mean().reset_index()
-    route_summary["Avg_Total_Cost"] = merged.groupby("Route")["Total_Cost"].mean().values
-
-    fig5 = px.scatter(
-        route_summary, x="Distance_KM", y="Avg_Total_Cost",
-        size="Fuel_Consumption_L", color="Toll_Charges_INR",
-        hover_name="Route", title="Route Distance vs Avg Total Cost",
-        color_continuous_scale="Viridis"
+    route_summary = group_means(
+        merged, "Route",
+        Distance_KM="Distance_KM",
+        Toll_Charges_INR="Toll_Charges_INR",
+        Fuel_Consumption_L="Fuel_Consumption_L",
+        Avg_Total_Cost="Total_Cost",
     )
+
+    fig5 = fig_route_costs(route_summary)
     st.plotly_chart(fig5, use_container_width=True)
 
     st.markdown("""
@@ -163,12 +372,8 @@ elif page == "Cost Leakage Analysis":
     # --- 4️⃣ Vehicle Fleet Cost Analysis ---
     st.markdown("### 4️⃣ Analyze Vehicle Fleet Data")
 
-    fleet_fig = px.scatter(
-        fleet, x="Age_Years", y="Fuel_Efficiency_KM_per_L",
-        color="Vehicle_Type", size="CO2_Emissions_Kg_per_KM",
-        title="Vehicle Age vs Fuel Efficiency and Emissions",
-        color_discrete_sequence=px.colors.qualitative.D3
-    )
+    fleet_fig = fig_fleet_efficiency(fleet, "Vehicle Age vs Fuel Efficiency and Emissions",
+                                     size="CO2_Emissions_Kg_per_KM")
     st.plotly_chart(fleet_fig, use_container_width=True)
 
     st.markdown("""
@@ -179,11 +384,7 @@ elif page == "Cost Leakage Analysis":
     # --- 5️⃣ Warehouse and Inventory Cost Insights ---
     st.markdown("### 5️⃣ Analyze Warehouse and Inventory Costs")
 
-    fig6 = px.bar(
-        warehouse, x="Location", y="Storage_Cost_per_Unit",
-        color="Product_Category", title="Warehouse Storage Cost per Unit",
-        color_discrete_sequence=px.colors.qualitative.Bold
-    )
+    fig6 = fig_warehouse_costs(warehouse, "Warehouse Storage Cost per Unit")
     st.plotly_chart(fig6, use_container_width=True)
 
     high_cost_wh = warehouse[warehouse["Storage_Cost_per_Unit"] > warehouse["Storage_Cost_per_Unit"].mean()]
@@ -196,12 +397,7 @@ elif page == "Cost Leakage Analysis":
     # --- 6️⃣ Customer Feedback and Cost Correlation ---
     st.markdown("### 6️⃣ Analyze Customer Feedback and Its Link to Costs")
 
-    feedback_cost = merged.merge(feedback, on="Order_ID", how="left")
-    fig7 = px.box(
-        feedback_cost, x="Rating", y="Cost_to_OrderValue",
-        color="Would_Recommend", title="Customer Rating vs Cost-to-Order Value",
-        color_discrete_sequence=px.colors.qualitative.Safe
-    )
+    fig7 = fig_feedback_costs(merged[["Rating", "Cost_to_OrderValue", "Would_Recommend"]])
     st.plotly_chart(fig7, use_container_width=True)
 
     st.markdown("""
@@ -217,49 +413,45 @@ elif page == "Optimization Opportunities":
     st.subheader("🚀 Optimization Opportunities")
 
     # Route Optimization Insight
-    route_perf = merged.groupby("Route")[["Distance_KM", "Toll_Charges_INR", "Traffic_Delay_Minutes"]].mean().reset_index()
-    fig4 = px.scatter_3d(
-        route_perf, x="Distance_KM", y="Toll_Charges_INR", z="Traffic_Delay_Minutes",
-        color="Traffic_Delay_Minutes", title="Route Performance: Distance vs Toll vs Delay",
-        color_continuous_scale="Turbo"
+    route_perf = group_means(
+        base, "Route",
+        Distance_KM="Distance_KM",
+        Toll_Charges_INR="Toll_Charges_INR",
+        Traffic_Delay_Minutes="Traffic_Delay_Minutes",
     )
+    fig4 = fig_route_performance(route_perf)
     st.plotly_chart(fig4, use_container_width=True)
 
     # Warehouse Cost Insight
-    fig5 = px.bar(
-        warehouse, x="Location", y="Storage_Cost_per_Unit",
-        color="Product_Category", title="Warehouse Storage Costs",
-        color_discrete_sequence=px.colors.qualitative.Bold
-    )
+    fig5 = fig_warehouse_costs(warehouse, "Warehouse Storage Costs")
     st.plotly_chart(fig5, use_container_width=True)
 
     # Fleet Insight
-    fig6 = px.scatter(
-        fleet, x="Age_Years", y="Fuel_Efficiency_KM_per_L", color="Vehicle_Type",
-        title="Vehicle Age vs Fuel Efficiency", color_discrete_sequence=px.colors.qualitative.D3
-    )
+    fig6 = fig_fleet_efficiency(fleet, "Vehicle Age vs Fuel Efficiency")
     st.plotly_chart(fig6, use_container_width=True)
 
 # ---------------------- 4. AI RECOMMENDATIONS ----------------------
 elif page == "AI Recommendations":
     st.subheader("🤖 AI-Powered Recommendations")
+    merged, _ = add_cost_metrics(base)
 
     # Simple ML model to predict total cost
     features = ["Fuel_Cost", "Labor_Cost", "Vehicle_Maintenance", "Insurance",
                 "Packaging_Cost", "Technology_Platform_Fee", "Other_Overhead"]
-    X = merged[features]
+    X = merged[features].fillna(0)  # missing components count as zero in Total_Cost
     y = merged["Total_Cost"]
 
-    model = RandomForestRegressor(n_estimators=100, random_state=42)
-    model.fit(X, y)
-    merged["Predicted_Cost"] = model.predict(X)
-
-    fig7 = go.Figure()
-    fig7.add_trace(go.Scatter(x=merged["Order_ID"], y=merged["Total_Cost"],
-                              mode='lines', name='Actual Cost', line=dict(color='royalblue')))
-    fig7.add_trace(go.Scatter(x=merged["Order_ID"], y=merged["Predicted_Cost"],
-                              mode='lines', name='Predicted Cost', line=dict(color='orange')))
-    fig7.update_layout(title="Actual vs Predicted Total Cost", xaxis_title="Order ID", yaxis_title="Cost (INR)")
+    model = get_cost_model(X.values, y.values)
+    merged["Predicted_Cost"] = predict_cost(model, X.values)
+
+    # Plot against the order's position rather than its Order_ID string, so the
+    # figure ships an integer range instead of N labels
+    trend = merged.sort_values("Order_ID", ignore_index=True)
+    actual = trend["Total_Cost"].to_numpy(np.float32)
+    keep = lttb_indices(actual, 2000)
+
+    fig7 = fig_actual_vs_predicted(keep.astype(np.int32), actual[keep],
+                                   trend["Predicted_Cost"].to_numpy(np.float32)[keep])
     st.plotly_chart(fig7, use_container_width=True)
 
     # Strategic Recommendations
@@ -296,10 +488,7 @@ elif page == "AI Recommendations":
         "Potential_Savings_%": [10, 15, 12, 8, 10]
     })
 
-    fig8 = px.bar(rec_data, x="Strategy", y="Potential_Savings_%",
-                  color="Strategy", text="Potential_Savings_%",
-                  color_discrete_sequence=px.colors.qualitative.Alphabet,
-                  title="Estimated Savings by Recommendation (%)")
+    fig8 = fig_savings(rec_data)
     st.plotly_chart(fig8, use_container_width=True)
 
 # ---------------------- FOOTER ----------------------
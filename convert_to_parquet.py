@@ -0,0 +1,26 @@
+# convert_to_parquet.py — one-off conversion of the source CSVs to typed Parquet
+#
+# Run after editing any of the CSVs:  python convert_to_parquet.py
+
+import pandas as pd
+
+# Low-cardinality string columns stored as categoricals, so readers (and every
+# groupby / colour grouping in app.py) work on small integer codes.
+CATEGORICAL_COLS = {
+    "orders": ["Product_Category"],
+    "delivery_performance": ["Carrier", "Delivery_Status"],
+    "routes_distance": ["Route"],
+    "vehicle_fleet": ["Vehicle_Type"],
+    "warehouse_inventory": ["Location", "Product_Category"],
+    "customer_feedback": ["Would_Recommend"],
+    "cost_breakdown": [],
+}
+
+for name, cat_cols in CATEGORICAL_COLS.items():
+    df = pd.read_csv(f"{name}.csv")
+    for col in df.select_dtypes("int64"):
+        df[col] = df[col].astype("int32")
+    for col in cat_cols:
+        df[col] = df[col].astype("category")
+    df.to_parquet(f"{name}.parquet", compression="zstd", index=False)
+    print(f"{name}.csv -> {name}.parquet")